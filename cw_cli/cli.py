@@ -2,26 +2,9 @@
 """Main CLI entry point for CW CLI."""
 
 import sys
-from simple_parsing import ArgumentParser
+from importlib import import_module
 
-from .config import (
-    TrainConfig, GrpoConfig, GrpoRestartConfig, VerifiersConfig, EvalConfig, LogsConfig, StatusConfig, DeleteConfig, 
-    ListConfig, JobsConfig, PodsConfig, InfoConfig, ResourcesConfig, GpuConfig, DevPodConfig
-)
-from .commands import (
-    train_command, grpo_command, grpo_restart_command, verifiers_grpo_command, verifiers_eval_command, logs_command, status_command, delete_command,
-    list_command, jobs_command, pods_command, info_command, resources_command, gpu_command, devpod_command
-)
-
-
-def main():
-    """CW CLI - Kubernetes job management for ML training"""
-    
-    import argparse
-    
-    parser = ArgumentParser(
-        description="CW CLI - Kubernetes job management for ML training",
-        epilog="""Examples:
+_EPILOG = """Examples:
   # Training
   cw axolotl sft axolotl/sft_config.yaml              Train a model with SFT
   cw axolotl sft config.yaml --gpu 6                  Override GPU count
@@ -30,19 +13,19 @@ def main():
   cw axolotl grpo train config.yaml --services        Deploy only GRPO services (VLLM + Rewards)
   cw verifiers grpo verifiers/conf.yaml               Train with Verifiers GRPO
   cw verifiers grpo config.yaml --services            Deploy only Verifiers services (VLLM + Rewards)
-  
+
   # GRPO service management
   cw axolotl grpo restart vllm                Restart VLLM service
   cw axolotl grpo restart rewards             Restart rewards service
-  
-  # Resource monitoring  
+
+  # Resource monitoring
   cw jobs -A                                  List all jobs (all namespaces)
   cw pods -w -r                               Watch pods with resources
   cw nodes -n                                 Show detailed node info
   cw resources                                Show available cluster resources
   cw gpu                                      Watch nvidia-smi on training node
   cw gpu my-job -i 5                          Watch specific job's GPU every 5s
-  
+
   # Job management
   cw describe                                 Select job to check status
   cw describe my-job -w                       Watch specific job status
@@ -50,7 +33,7 @@ def main():
   cw logs -j my-job                           Follow specific job logs
   cw delete                                   Select job to delete
   cw delete my-job                            Delete specific job
-  
+
   # Development pods
   cw devpod start                             Create/start a devpod (interactive)
   cw devpod start mydev --gpu 4 --cpu 32     Create devpod with custom resources
@@ -59,99 +42,293 @@ def main():
   cw devpod list                              List all devpods
   cw devpod stop mydev                        Stop a devpod
   cw devpod delete mydev                      Delete a devpod
-  
+
   # Quick workflows
   cw jobs | grep Running                      Find running jobs
-  cw pods -A | grep gpu                       Find GPU pods""",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    # Add subparsers for different commands
-    subparsers_dict = parser.add_subparsers(
-        title="Commands",
-        description="Available commands (use 'cw <command> --help' for more info)"
-    )
-    
-    # Training commands
-    axolotl_parser = subparsers_dict.add_parser("axolotl", help="Train models")
+  cw pods -A | grep gpu                       Find GPU pods"""
+
+
+# Help text for a bare `cw`, precomputed so no parser has to be built for it.
+# Keep in sync with the subcommand help strings in the _add_* builders below.
+_STATIC_HELP = """usage: cw [-h]
+          {axolotl,verifiers,jobs,pods,nodes,resources,gpu,logs,describe,delete,devpod,list}
+          ...
+
+CW CLI - Kubernetes job management for ML training
+
+options:
+  -h, --help            show this help message and exit
+
+Commands:
+  Available commands (use 'cw <command> --help' for more info)
+
+  {axolotl,verifiers,jobs,pods,nodes,resources,gpu,logs,describe,delete,devpod,list}
+    axolotl             Train models
+    verifiers           Verifiers training framework
+    jobs                List jobs
+    pods                List pods
+    nodes               List nodes
+    resources           Show available cluster resources
+    gpu                 Watch GPU usage on training nodes
+    logs                View logs
+    describe            Describe job
+    delete              Delete job
+    devpod              Manage development pods
+    list                List axolotl jobs
+
+""" + _EPILOG + "\n"
+
+
+def _command(name):
+    """Resolve a command handler lazily so unused modules are never imported."""
+    return getattr(import_module('.commands', __package__), name)
+
+
+def _run_sft(args):
+    return _command('train_command')(args.train_config, args.extra_args)
+
+
+def _run_grpo_train(args):
+    return _command('grpo_command')(args.grpo_config, args.extra_args)
+
+
+def _run_grpo_restart(args):
+    return _command('grpo_restart_command')(args.grpo_restart_config.service)
+
+
+def _run_verifiers_grpo(args):
+    return _command('verifiers_grpo_command')(args.verifiers_config, args.extra_args)
+
+
+def _run_verifiers_eval(args):
+    return _command('verifiers_eval_command')(args.eval_config, args.extra_args)
+
+
+def _run_jobs(args):
+    return _command('jobs_command')(args.jobs_config.namespace, args.jobs_config.all_namespaces)
+
+
+def _run_pods(args):
+    return _command('pods_command')(args.pods_config.namespace, args.pods_config.all_namespaces, args.pods_config.show_resources, args.pods_config.watch)
+
+
+def _run_nodes(args):
+    return _command('info_command')(args.nodes)
+
+
+def _run_resources(args):
+    return _command('resources_command')()
+
+
+def _run_gpu(args):
+    return _command('gpu_command')(args.gpu_config.job, args.gpu_config.interval)
+
+
+def _run_logs(args):
+    return _command('logs_command')(args.logs_config)
+
+
+def _run_describe(args):
+    return _command('status_command')(args.status_config.job, args.status_config.watch, args.status_config.output)
+
+
+def _run_delete(args):
+    return _command('delete_command')(args.delete_config.job)
+
+
+def _run_devpod(args):
+    return _command('devpod_command')(args.devpod_config)
+
+
+def _run_list(args):
+    return _command('list_command')()
+
+
+def _add_axolotl(subparsers):
+    """Build the `cw axolotl` subcommand tree."""
+    from .config import TrainConfig, GrpoConfig, GrpoRestartConfig
+
+    axolotl_parser = subparsers.add_parser("axolotl", help="Train models")
     axolotl_subparsers = axolotl_parser.add_subparsers()
-    
+
     sft_parser = axolotl_subparsers.add_parser("sft", help="Train a model with SFT")
     sft_parser.add_arguments(TrainConfig, dest="train_config")
-    sft_parser.set_defaults(func=lambda args: train_command(args.train_config))
-    
+    sft_parser.set_defaults(func=_run_sft)
+
     axolotl_grpo_parser = axolotl_subparsers.add_parser("grpo", help="GRPO training and management")
     axolotl_grpo_subparsers = axolotl_grpo_parser.add_subparsers()
-    
+
     # GRPO training subcommand
     grpo_train_parser = axolotl_grpo_subparsers.add_parser("train", help="Train a model with GRPO")
     grpo_train_parser.add_arguments(GrpoConfig, dest="grpo_config")
-    grpo_train_parser.set_defaults(func=lambda args: grpo_command(args.grpo_config))
-    
+    grpo_train_parser.set_defaults(func=_run_grpo_train)
+
     # GRPO restart subcommand
     grpo_restart_parser = axolotl_grpo_subparsers.add_parser("restart", help="Restart GRPO services")
     grpo_restart_parser.add_arguments(GrpoRestartConfig, dest="grpo_restart_config")
-    grpo_restart_parser.set_defaults(func=lambda args: grpo_restart_command(args.grpo_restart_config.service))
-    
-    # Verifiers training commands
-    verifiers_parser = subparsers_dict.add_parser("verifiers", help="Verifiers training framework")
+    grpo_restart_parser.set_defaults(func=_run_grpo_restart)
+
+
+def _add_verifiers(subparsers):
+    """Build the `cw verifiers` subcommand tree."""
+    from .config import VerifiersConfig, EvalConfig
+
+    verifiers_parser = subparsers.add_parser("verifiers", help="Verifiers training framework")
     verifiers_subparsers = verifiers_parser.add_subparsers()
-    
+
     verifiers_grpo_parser = verifiers_subparsers.add_parser("grpo", help="Train with Verifiers GRPO")
     verifiers_grpo_parser.add_arguments(VerifiersConfig, dest="verifiers_config")
-    verifiers_grpo_parser.set_defaults(func=lambda args: verifiers_grpo_command(args.verifiers_config))
-    
+    verifiers_grpo_parser.set_defaults(func=_run_verifiers_grpo)
+
     verifiers_eval_parser = verifiers_subparsers.add_parser("eval", help="Evaluate with Verifiers")
     verifiers_eval_parser.add_arguments(EvalConfig, dest="eval_config")
-    verifiers_eval_parser.set_defaults(func=lambda args: verifiers_eval_command(args.eval_config))
-    
-    # Resource listing
-    jobs_parser = subparsers_dict.add_parser("jobs", help="List jobs")
+    verifiers_eval_parser.set_defaults(func=_run_verifiers_eval)
+
+
+def _add_jobs(subparsers):
+    from .config import JobsConfig
+
+    jobs_parser = subparsers.add_parser("jobs", help="List jobs")
     jobs_parser.add_arguments(JobsConfig, dest="jobs_config")
-    jobs_parser.set_defaults(func=lambda args: jobs_command(args.jobs_config.namespace, args.jobs_config.all_namespaces))
-    
-    pods_parser = subparsers_dict.add_parser("pods", help="List pods")
+    jobs_parser.set_defaults(func=_run_jobs)
+
+
+def _add_pods(subparsers):
+    from .config import PodsConfig
+
+    pods_parser = subparsers.add_parser("pods", help="List pods")
     pods_parser.add_arguments(PodsConfig, dest="pods_config")
-    pods_parser.set_defaults(func=lambda args: pods_command(args.pods_config.namespace, args.pods_config.all_namespaces, args.pods_config.show_resources, args.pods_config.watch))
-    
-    nodes_parser = subparsers_dict.add_parser("nodes", help="List nodes")
-    nodes_parser.add_arguments(InfoConfig, dest="info_config")
-    nodes_parser.set_defaults(func=lambda args: info_command(args.info_config.nodes))
-    
-    resources_parser = subparsers_dict.add_parser("resources", help="Show available cluster resources")
-    resources_parser.add_arguments(ResourcesConfig, dest="resources_config")
-    resources_parser.set_defaults(func=lambda args: resources_command())
-    
-    gpu_parser = subparsers_dict.add_parser("gpu", help="Watch GPU usage on training nodes")
+    pods_parser.set_defaults(func=_run_pods)
+
+
+def _add_nodes(subparsers):
+    # Plain argparse; no dataclass introspection needed for a single flag
+    nodes_parser = subparsers.add_parser("nodes", help="List nodes")
+    nodes_parser.add_argument("-n", "--nodes", action="store_true", help="Show detailed node information")
+    nodes_parser.set_defaults(func=_run_nodes)
+
+
+def _add_resources(subparsers):
+    resources_parser = subparsers.add_parser("resources", help="Show available cluster resources")
+    resources_parser.set_defaults(func=_run_resources)
+
+
+def _add_gpu(subparsers):
+    from .config import GpuConfig
+
+    gpu_parser = subparsers.add_parser("gpu", help="Watch GPU usage on training nodes")
     gpu_parser.add_arguments(GpuConfig, dest="gpu_config")
-    gpu_parser.set_defaults(func=lambda args: gpu_command(args.gpu_config.job, args.gpu_config.interval))
-    
-    # Job management
-    logs_parser = subparsers_dict.add_parser("logs", help="View logs")
+    gpu_parser.set_defaults(func=_run_gpu)
+
+
+def _add_logs(subparsers):
+    from .config import LogsConfig
+
+    logs_parser = subparsers.add_parser("logs", help="View logs")
     logs_parser.add_arguments(LogsConfig, dest="logs_config")
-    logs_parser.set_defaults(func=lambda args: logs_command(args.logs_config))
-    
-    describe_parser = subparsers_dict.add_parser("describe", help="Describe job")
+    logs_parser.set_defaults(func=_run_logs)
+
+
+def _add_describe(subparsers):
+    from .config import StatusConfig
+
+    describe_parser = subparsers.add_parser("describe", help="Describe job")
     describe_parser.add_arguments(StatusConfig, dest="status_config")
-    describe_parser.set_defaults(func=lambda args: status_command(args.status_config.job, args.status_config.watch, args.status_config.output))
-    
-    delete_parser = subparsers_dict.add_parser("delete", help="Delete job")
+    describe_parser.set_defaults(func=_run_describe)
+
+
+def _add_delete(subparsers):
+    from .config import DeleteConfig
+
+    delete_parser = subparsers.add_parser("delete", help="Delete job")
     delete_parser.add_arguments(DeleteConfig, dest="delete_config")
-    delete_parser.set_defaults(func=lambda args: delete_command(args.delete_config.job))
-    
-    # Development pods
-    devpod_parser = subparsers_dict.add_parser("devpod", help="Manage development pods")
+    delete_parser.set_defaults(func=_run_delete)
+
+
+def _add_devpod(subparsers):
+    from .config import DevPodConfig
+
+    devpod_parser = subparsers.add_parser("devpod", help="Manage development pods")
     devpod_parser.add_arguments(DevPodConfig, dest="devpod_config")
-    devpod_parser.set_defaults(func=lambda args: devpod_command(args.devpod_config))
-    
-    # Legacy
-    list_parser = subparsers_dict.add_parser("list", help="List axolotl jobs")
-    list_parser.add_arguments(ListConfig, dest="list_config") 
-    list_parser.set_defaults(func=lambda args: list_command())
-    
-    # Parse arguments and execute the appropriate function
+    devpod_parser.set_defaults(func=_run_devpod)
+
+
+def _add_list(subparsers):
+    list_parser = subparsers.add_parser("list", help="List axolotl jobs")
+    list_parser.set_defaults(func=_run_list)
+
+
+# Static name -> builder table used to construct only the invoked subcommand.
+_BUILDERS = {
+    "axolotl": _add_axolotl,
+    "verifiers": _add_verifiers,
+    "jobs": _add_jobs,
+    "pods": _add_pods,
+    "nodes": _add_nodes,
+    "resources": _add_resources,
+    "gpu": _add_gpu,
+    "logs": _add_logs,
+    "describe": _add_describe,
+    "delete": _add_delete,
+    "devpod": _add_devpod,
+    "list": _add_list,
+}
+
+
+def _sniff_subcommand(argv):
+    """Peek at argv for the first non-flag token to pick a single builder."""
+    return next((arg for arg in argv if not arg.startswith('-')), None)
+
+
+def _build_parser(command=None):
+    """Build the argument parser.
+
+    When `command` matches a known subcommand, only that branch of the
+    parser tree is constructed; otherwise (e.g. `cw --help`) the full
+    tree is built.
+    """
+    import argparse
+
+    # simple_parsing pulls in docstring/typing introspection machinery;
+    # defer it until a parser is actually needed.
+    from simple_parsing import ArgumentParser
+
+    parser = ArgumentParser(
+        description="CW CLI - Kubernetes job management for ML training",
+        epilog=_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    # Add subparsers for different commands
+    subparsers = parser.add_subparsers(
+        title="Commands",
+        description="Available commands (use 'cw <command> --help' for more info)"
+    )
+
+    builder = _BUILDERS.get(command)
+    if builder is not None:
+        builder(subparsers)
+    else:
+        for build in _BUILDERS.values():
+            build(subparsers)
+
+    return parser
+
+
+def main():
+    """CW CLI - Kubernetes job management for ML training"""
+    # Bare `cw` only ever prints help; skip parser construction entirely
+    if len(sys.argv) == 1:
+        sys.stdout.write(_STATIC_HELP)
+        return 1
+
+    parser = _build_parser(_sniff_subcommand(sys.argv[1:]))
+
+    # Parse arguments and execute the appropriate function; the leftover
+    # tokens are the --key value config overrides for training commands
     args, unknown = parser.parse_known_args()
-    
+    args.extra_args = unknown
+
     if hasattr(args, 'func'):
         return args.func(args)
     else:
@@ -160,4 +337,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -1,75 +1,145 @@
 #!/usr/bin/env python3
 """Cluster info command implementation."""
 
-import yaml
+import re
+import subprocess
 from .utils import console, kubectl
 from .display import create_table
 
+# Projection of the node fields we actually display. Asking kubectl for a
+# go-template keeps the payload to a handful of fields per node instead of
+# the full node objects, and line parsing replaces JSON decoding entirely.
+_NODES_TEMPLATE = (
+    '{{range .items}}'
+    '{{.metadata.name}}|'
+    '{{range .status.conditions}}{{if eq .type "Ready"}}{{.status}}{{end}}{{end}}|'
+    '{{index .status.capacity "nvidia.com/gpu"}}|'
+    '{{.status.capacity.cpu}}|'
+    '{{.status.capacity.memory}}|'
+    '{{range $k, $v := .metadata.labels}}{{$k}}={{$v}},{{end}}|'
+    '{{.status.nodeInfo.osImage}}'
+    '{{"\\n"}}{{end}}'
+)
+
+# Precompiled matchers for GPU-type detection so label scanning stays in C
+_GPU_KEY_RE = re.compile(r'gpu|accelerator', re.I)
+_GPU_VAL_RE = re.compile(r'(h100|a100|v100|rtx)', re.I)
+_GPU_CANONICAL = {'h100': 'H100', 'a100': 'A100', 'v100': 'V100', 'rtx': 'RTX'}
+
+# Ready-status cells are constant; precompute them instead of branching per row
+_READY_STATUS = {'True': '✅'}
+
+
+def _to_int(value: str) -> int:
+    """Parse a capacity count, treating missing/non-numeric values as 0."""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _memory_to_gb(value: str) -> int:
+    """Convert a Kubernetes memory quantity (Ki/Mi/Gi) to whole GB."""
+    try:
+        if value.endswith('Ki'):
+            return int(value[:-2]) >> 20
+        elif value.endswith('Mi'):
+            return int(value[:-2]) >> 10
+        elif value.endswith('Gi'):
+            return int(value[:-2])
+    except ValueError:
+        pass
+    return 0
+
+
+def _detect_gpu_type(labels: dict) -> str:
+    """Detect the GPU model advertised in node labels."""
+    for label_key, label_value in labels.items():
+        if _GPU_KEY_RE.search(label_key):
+            match = _GPU_VAL_RE.search(label_value)
+            if match:
+                return _GPU_CANONICAL[match.group(1).lower()]
+            break
+    return ""
+
 
 def show_cluster_info(show_nodes: bool = False) -> int:
     """Show cluster information and capabilities."""
     try:
-        # Get nodes
-        nodes_result = kubectl("get", "nodes", "-o", "json", capture_output=True)
-        nodes_data = yaml.safe_load(nodes_result.stdout)
-        
-        if not nodes_data.get('items'):
-            console.print("❌ No nodes found in cluster", style="red")
-            return 1
-        
-        # Calculate totals
+        # Get nodes (projected to just the fields we display); stream the
+        # output so parsing overlaps with kubectl's apiserver fetch
+        nodes_proc = kubectl("get", "nodes", "-o", f"go-template={_NODES_TEMPLATE}", stream=True)
+
+        # Totals and table rows are accumulated in a single pass over the nodes
         total_gpus = 0
         total_cpus = 0
         total_memory = 0
         gpu_types = set()
         ready_nodes = 0
-        
-        for node in nodes_data['items']:
-            conditions = node.get('status', {}).get('conditions', [])
-            ready_condition = next((c for c in conditions if c['type'] == 'Ready'), {})
-            if ready_condition.get('status') == 'True':
+        rows = []
+
+        for line in nodes_proc.stdout:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            node_name, ready_status, gpu_capacity, cpu_capacity, memory_capacity, labels_str, os_image = line.split('|', 6)
+
+            is_ready = ready_status == 'True'
+            if is_ready:
                 ready_nodes += 1
-            
-            capacity = node.get('status', {}).get('capacity', {})
-            labels = node['metadata'].get('labels', {})
-            
-            # GPU info
-            gpu_capacity = capacity.get('nvidia.com/gpu', '0')
-            total_gpus += int(gpu_capacity) if gpu_capacity.isdigit() else 0
-            
-            # CPU info  
-            cpu_capacity = capacity.get('cpu', '0')
-            total_cpus += int(cpu_capacity) if cpu_capacity.isdigit() else 0
-            
+
+            # GPU info ("<no value>" when the node has no GPU capacity field)
+            gpu_count = _to_int(gpu_capacity)
+            total_gpus += gpu_count
+
+            # CPU info
+            total_cpus += _to_int(cpu_capacity)
+
             # Memory info
-            memory_capacity = capacity.get('memory', '0Ki')
-            memory_gb = int(memory_capacity.replace('Ki', '')) // 1024 // 1024 if 'Ki' in memory_capacity else 0
+            memory_gb = _memory_to_gb(memory_capacity)
             total_memory += memory_gb
-            
-            # GPU types
-            for label_key, label_value in labels.items():
-                if 'gpu' in label_key.lower() or 'accelerator' in label_key.lower():
-                    if 'h100' in label_value.lower():
-                        gpu_types.add("H100")
-                    elif 'a100' in label_value.lower():
-                        gpu_types.add("A100")
-                    elif 'v100' in label_value.lower():
-                        gpu_types.add("V100")
-                    elif 'rtx' in label_value.lower():
-                        gpu_types.add("RTX")
-                    break
-            
-            if not gpu_types and int(gpu_capacity) > 0:
+
+            # GPU type
+            labels = dict(pair.split('=', 1) for pair in labels_str.split(',') if pair)
+            gpu_type = _detect_gpu_type(labels)
+            if gpu_type:
+                gpu_types.add(gpu_type)
+            elif gpu_count > 0:
                 gpu_types.add("GPU")
-        
+
+            gpu_display = f"[green]{gpu_count}[/green]" if gpu_count > 0 else "0"
+            if gpu_type:
+                gpu_display += f" {gpu_type}"
+
+            row_data = [
+                node_name,
+                _READY_STATUS.get(ready_status, '❌'),
+                gpu_display,
+                cpu_capacity,
+                f"{memory_gb}GB"
+            ]
+
+            if show_nodes:
+                os_info = os_image.split()[0] if os_image and os_image != '<no value>' else 'N/A'  # Just first part
+                row_data.append(os_info)
+
+            rows.append(row_data)
+
+        if nodes_proc.wait() != 0:
+            raise subprocess.CalledProcessError(nodes_proc.returncode, "kubectl get nodes")
+
+        if not rows:
+            console.print("❌ No nodes found in cluster", style="red")
+            return 1
+
         # Display cluster overview
         console.print(f"[bold cyan]🏗️ Cluster Overview[/]")
-        console.print(f"  Nodes: {ready_nodes}/{len(nodes_data['items'])} ready")
+        console.print(f"  Nodes: {ready_nodes}/{len(rows)} ready")
         console.print(f"  GPUs: [green]{total_gpus}[/green] total ({', '.join(sorted(gpu_types)) if gpu_types else 'None'})")
         console.print(f"  CPUs: {total_cpus} total")
         console.print(f"  Memory: {total_memory}GB total")
         console.print()
-        
+
         # Node details table
         columns = [
             ("Node", "cyan"),
@@ -78,62 +148,18 @@ def show_cluster_info(show_nodes: bool = False) -> int:
             ("CPU", "blue"),
             ("Memory", "magenta")
         ]
-        
+
         if show_nodes:
             columns.append(("OS", "yellow"))
-        
+
         nodes_table = create_table("🖥️ Nodes", columns)
-        
-        for node in nodes_data['items']:
-            node_name = node['metadata']['name']
-            
-            # Get node status
-            conditions = node.get('status', {}).get('conditions', [])
-            ready_condition = next((c for c in conditions if c['type'] == 'Ready'), {})
-            status = "✅" if ready_condition.get('status') == 'True' else "❌"
-            
-            # Get resources
-            capacity = node.get('status', {}).get('capacity', {})
-            labels = node['metadata'].get('labels', {})
-            
-            # GPU info
-            gpu_capacity = capacity.get('nvidia.com/gpu', '0')
-            gpu_display = f"[green]{gpu_capacity}[/green]" if int(gpu_capacity) > 0 else "0"
-            
-            # Get GPU type
-            gpu_type = ""
-            for label_key, label_value in labels.items():
-                if 'gpu' in label_key.lower() or 'accelerator' in label_key.lower():
-                    if 'h100' in label_value.lower():
-                        gpu_type = " H100"
-                    elif 'a100' in label_value.lower():
-                        gpu_type = " A100"
-                    elif 'v100' in label_value.lower():
-                        gpu_type = " V100"
-                    elif 'rtx' in label_value.lower():
-                        gpu_type = " RTX"
-                    break
-            
-            gpu_display += gpu_type
-            
-            # CPU and Memory
-            cpu_capacity = capacity.get('cpu', '0')
-            memory_capacity = capacity.get('memory', '0Ki')
-            memory_gb = int(memory_capacity.replace('Ki', '')) // 1024 // 1024 if 'Ki' in memory_capacity else 0
-            
-            row_data = [node_name, status, gpu_display, cpu_capacity, f"{memory_gb}GB"]
-            
-            if show_nodes:
-                node_info = node.get('status', {}).get('nodeInfo', {})
-                os_info = node_info.get('osImage', 'N/A').split()[0]  # Just first part
-                row_data.append(os_info)
-            
+        for row_data in rows:
             nodes_table.add_row(*row_data)
-        
+
         console.print(nodes_table)
-        
+
         return 0
-        
+
     except Exception as e:
         console.print(f"❌ Failed to get cluster info: {e}", style="red")
-        return 1
\ No newline at end of file
+        return 1
@@ -2,43 +2,96 @@
 """Command implementations for CW CLI."""
 
 import subprocess
-import yaml
-import time
 import json
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, List
 
 from .utils import (
-    console, kubectl, cleanup_grpo_services, 
+    console, print_line, kubectl, kubectl_json_stream, cleanup_grpo_services, 
     get_available_devpods, prompt_devpod_selection, prompt_ssh_key_selection,
     deploy_devpod, ssh_to_devpod, cleanup_devpod
 )
-from .display import create_table, create_summary, get_age_string, get_job_status_emoji
+from .display import add_plain_row, create_table, create_summary, get_age_string, get_job_status_emoji
 
+# Label applied to every resource the CLI deploys; lets the API server do
+# the filtering instead of shipping the whole namespace to the client
+_CW_SELECTOR = "app.kubernetes.io/managed-by=cw-axolotl"
 
+
+@lru_cache(maxsize=1)
 def _get_available_jobs() -> List[str]:
-    """Get list of available CW jobs in the cluster (jobs with cw- prefix)."""
+    """Get list of available CW jobs in the cluster (jobs with cw- prefix).
+
+    Cached for the lifetime of the CLI process; the job list is stable
+    within a single invocation and may be consulted by several prompts.
+    """
     try:
-        result = kubectl("get", "jobs", "-o", "json", capture_output=True)
-        jobs_data = json.loads(result.stdout)
-        # Only return jobs that start with 'cw-'
-        cw_jobs = [job['metadata']['name'] for job in jobs_data.get('items', []) 
-                   if job['metadata']['name'].startswith('cw-')]
-        return cw_jobs
+        # Project only the names server-side instead of shipping full Job
+        # objects; prefix filtering on the short name list is then trivial
+        result = kubectl(
+            "get", "jobs", "-l", _CW_SELECTOR, "-o",
+            "jsonpath={range .items[*]}{.metadata.name}{'\\n'}{end}",
+            capture_output=True
+        )
+        # The selector already narrows to CW jobs; the prefix check only
+        # guards against unlabeled resources that happen to match
+        return [name for name in result.stdout.split() if name.startswith('cw-')]
     except Exception:
         return []
 
 
+@lru_cache(maxsize=None)
+def _kubectl_json(resource: str, namespace: str = None, all_namespaces: bool = False,
+                  selector: str = None) -> Dict[str, Any]:
+    """Fetch a resource list as parsed JSON, cached for the process lifetime.
+
+    Several commands query the same resource within one invocation; caching
+    the parsed payload avoids repeated kubectl forks and JSON parses.
+    Mutating commands must call _kubectl_json.cache_clear() before writing.
+    """
+    cmd_args = ["get", resource]
+    if all_namespaces:
+        cmd_args.append("--all-namespaces")
+    elif namespace:
+        cmd_args.extend(["-n", namespace])
+    if selector:
+        cmd_args.extend(["-l", selector])
+    # Paginate large lists server-side; kubectl follows the continuation
+    # tokens itself and still returns a single merged list
+    cmd_args.append("--chunk-size=500")
+    return kubectl_json_stream(*cmd_args)
+
+
 def _is_grpo_job(job_name: str) -> bool:
     """Check if the given job is a GRPO job based on its name."""
     return job_name == "cw-axolotl-train-grpo"
 
 
+# Remembered selections for read-only actions, keyed by (jobs, action);
+# destructive actions (delete) must always re-prompt
+_selection_cache: Dict[tuple, str] = {}
+_READ_ONLY_ACTIONS = {"view logs for", "check status for", "watch GPU usage for"}
+
+
 def _prompt_job_selection(jobs: List[str], action: str) -> str:
     """Prompt user to select a job from available jobs."""
     if not jobs:
         console.print(f"❌ No jobs found in cluster", style="red")
         return ""
-    
+
+    cache_key = (tuple(jobs), action)
+    if action in _READ_ONLY_ACTIONS and _selection_cache.get(cache_key):
+        return _selection_cache[cache_key]
+
+    selected = _prompt_job_selection_uncached(jobs, action)
+    if selected and action in _READ_ONLY_ACTIONS:
+        _selection_cache[cache_key] = selected
+    return selected
+
+
+def _prompt_job_selection_uncached(jobs: List[str], action: str) -> str:
+    """Run the interactive selection flow."""
     if len(jobs) == 1:
         job_name = jobs[0]
         response = console.input(f"Do you want to {action} [cyan]{job_name}[/]? (y/N): ").strip().lower()
@@ -63,8 +116,13 @@ def _prompt_job_selection(jobs: List[str], action: str) -> str:
         if choice in jobs:
             return choice
         
-        # Partial match
-        matches = [job for job in jobs if choice.lower() in job.lower()]
+        # Partial match: lowercase every name once, prefer prefix matches
+        # and only fall back to the substring scan when none start with it
+        choice_lower = choice.lower()
+        lowered = [job.lower() for job in jobs]
+        matches = [job for job, low in zip(jobs, lowered) if low.startswith(choice_lower)]
+        if not matches:
+            matches = [job for job, low in zip(jobs, lowered) if choice_lower in low]
         if len(matches) == 1:
             return matches[0]
         elif len(matches) > 1:
@@ -79,41 +137,39 @@ def _prompt_job_selection(jobs: List[str], action: str) -> str:
 
 
 def _follow_job_logs(job_name: str):
-    """Follow job logs with wait for pod readiness."""
+    """Follow job logs, waiting for pod readiness via a kubectl watch."""
     console.print("📡 Waiting for pod to be ready...", style="blue")
-    
-    # Wait for pod to be ready (up to 5 minutes)
-    max_wait = 300  # 5 minutes
-    wait_time = 0
-    
-    while wait_time < max_wait:
-        try:
-            # Check if pod is ready
-            result = kubectl("get", "pods", "-l", f"job-name={job_name}", "-o", "json", capture_output=True)
-            pods_data = json.loads(result.stdout)
-            
-            if pods_data.get('items'):
-                pod = pods_data['items'][0]
-                phase = pod.get('status', {}).get('phase')
-                
-                if phase == 'Running':
-                    console.print("📡 Following logs... (Press Ctrl+C to stop)", style="blue")
-                    kubectl("logs", "-f", f"job/{job_name}")
-                    return
-                elif phase in ['Failed', 'Succeeded']:
-                    console.print(f"📡 Pod finished with status: {phase}. Showing logs...", style="yellow")
-                    kubectl("logs", f"job/{job_name}")
-                    return
-                else:
-                    console.print(f"⏳ Pod status: {phase}, waiting...", style="yellow")
-            
-        except Exception as e:
-            console.print(f"⏳ Waiting for pod... ({e})", style="yellow")
-        
-        time.sleep(5)
-        wait_time += 5
-    
-    console.print("❌ Timeout waiting for pod to be ready. Try 'cw logs' later.", style="red")
+
+    # Watch pod phase transitions instead of polling every few seconds;
+    # the server pushes each change the moment it happens (up to 5 minutes)
+    phase_template = '{{.status.phase}}{{"\\n"}}'
+    watch_proc = kubectl(
+        "get", "pods", "-l", f"job-name={job_name}",
+        "--watch", "--request-timeout=300s",
+        "-o", f"go-template={phase_template}",
+        stream=True
+    )
+
+    phase = None
+    try:
+        for line in watch_proc.stdout:
+            phase = line.strip()
+            if phase in ['Running', 'Failed', 'Succeeded']:
+                break
+            if phase:
+                print_line(f"⏳ Pod status: {phase}, waiting...", style="yellow")
+    finally:
+        watch_proc.terminate()
+        watch_proc.wait()
+
+    if phase == 'Running':
+        console.print("📡 Following logs... (Press Ctrl+C to stop)", style="blue")
+        kubectl("logs", "-f", f"job/{job_name}")
+    elif phase in ['Failed', 'Succeeded']:
+        console.print(f"📡 Pod finished with status: {phase}. Showing logs...", style="yellow")
+        kubectl("logs", f"job/{job_name}")
+    else:
+        console.print("❌ Timeout waiting for pod to be ready. Try 'cw logs' later.", style="red")
 
 
 def parse_overrides(args: List[str]) -> Dict[str, Any]:
@@ -125,19 +181,21 @@ def parse_overrides(args: List[str]) -> Dict[str, Any]:
             key = args[i][2:]  # Remove '--'
             if i + 1 < len(args) and not args[i + 1].startswith('--'):
                 value = args[i + 1]
-                # Try to convert to appropriate type
-                try:
-                    # Try int first
-                    if value.isdigit():
+                # Convert to the type the YAML config expects: bool/null
+                # literals first, then int, then float, then string
+                lowered = value.lower()
+                if lowered in ('true', 'false'):
+                    overrides[key] = lowered == 'true'
+                elif lowered == 'null':
+                    overrides[key] = None
+                else:
+                    try:
                         overrides[key] = int(value)
-                    # Try float
-                    elif '.' in value and value.replace('.', '').isdigit():
-                        overrides[key] = float(value)
-                    # Keep as string
-                    else:
-                        overrides[key] = value
-                except ValueError:
-                    overrides[key] = value
+                    except ValueError:
+                        try:
+                            overrides[key] = float(value)
+                        except ValueError:
+                            overrides[key] = value
                 i += 2
             else:
                 # Boolean flag
@@ -150,43 +208,28 @@ def parse_overrides(args: List[str]) -> Dict[str, Any]:
 
 def apply_overrides(config_data: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
     """Apply command line overrides to config data."""
-    for key, value in overrides.items():
-        console.print(f"🔧 Override: {key} = {value}", style="yellow")
-        config_data[key] = value
+    if overrides:
+        console.print(
+            "\n".join(f"🔧 Override: {key} = {value}" for key, value in overrides.items()),
+            style="yellow"
+        )
+        config_data.update(overrides)
     return config_data
 
 
-def train_command(train_config) -> int:
-    """Train a model with Axolotl using new architecture."""
-    from .core.commands import train_sft_command
-    from .core.exceptions import format_error_for_user, get_error_suggestions
-    
-    try:
-        return train_sft_command(
-            framework_name="axolotl",
-            config_path=train_config.config,
-            pull_latest=train_config.pull
-        )
-    except Exception as e:
-        console.print(format_error_for_user(e), style="red")
-        suggestion = get_error_suggestions(e)
-        if suggestion:
-            console.print(suggestion, style="yellow")
-        return 1
-
+def _run_training(entry_point: str, **kwargs) -> int:
+    """Run a core training entry point with the shared error reporting.
 
-def grpo_command(grpo_config) -> int:
-    """Train a model with GRPO using new architecture."""
-    from .core.commands import train_grpo_command
+    The four training commands differ only in which core function they
+    call and its arguments; the try/except scaffolding lives here once.
+    Imports stay call-time because cw_cli.core.commands imports back
+    from this module.
+    """
+    from .core import commands as core_commands
     from .core.exceptions import format_error_for_user, get_error_suggestions
-    
+
     try:
-        return train_grpo_command(
-            framework_name="axolotl",
-            config_path=grpo_config.config,
-            pull_latest=grpo_config.pull,
-            services_only=grpo_config.services
-        )
+        return getattr(core_commands, entry_point)(**kwargs)
     except Exception as e:
         console.print(format_error_for_user(e), style="red")
         suggestion = get_error_suggestions(e)
@@ -195,47 +238,58 @@ def grpo_command(grpo_config) -> int:
         return 1
 
 
-def verifiers_grpo_command(verifiers_config) -> int:
-    """Train a model with Verifiers GRPO using new architecture."""
-    from .core.commands import train_grpo_command
-    from .core.exceptions import format_error_for_user, get_error_suggestions
-    
-    try:
-        return train_grpo_command(
-            framework_name="verifiers",
-            config_path=verifiers_config.config,
-            pull_latest=verifiers_config.pull,
-            services_only=verifiers_config.services
-        )
-    except Exception as e:
-        console.print(format_error_for_user(e), style="red")
-        suggestion = get_error_suggestions(e)
-        if suggestion:
-            console.print(suggestion, style="yellow")
-        return 1
+def train_command(train_config, extra_args: List[str] = None) -> int:
+    """Train a model with Axolotl using new architecture."""
+    _kubectl_json.cache_clear()
+    return _run_training(
+        "train_sft_command",
+        framework_name="axolotl",
+        config_path=train_config.config,
+        pull_latest=train_config.pull,
+        override_args=extra_args
+    )
 
 
-def verifiers_eval_command(eval_config) -> int:
+def grpo_command(grpo_config, extra_args: List[str] = None) -> int:
+    """Train a model with GRPO using new architecture."""
+    _kubectl_json.cache_clear()
+    return _run_training(
+        "train_grpo_command",
+        framework_name="axolotl",
+        config_path=grpo_config.config,
+        pull_latest=grpo_config.pull,
+        services_only=grpo_config.services,
+        override_args=extra_args
+    )
+
+
+def verifiers_grpo_command(verifiers_config, extra_args: List[str] = None) -> int:
+    """Train a model with Verifiers GRPO using new architecture."""
+    _kubectl_json.cache_clear()
+    return _run_training(
+        "train_grpo_command",
+        framework_name="verifiers",
+        config_path=verifiers_config.config,
+        pull_latest=verifiers_config.pull,
+        services_only=verifiers_config.services,
+        override_args=extra_args
+    )
+
+
+def verifiers_eval_command(eval_config, extra_args: List[str] = None) -> int:
     """Evaluate a model with Verifiers using new architecture."""
-    from .core.commands import train_eval_command
-    from .core.exceptions import format_error_for_user, get_error_suggestions
-    
-    try:
-        return train_eval_command(
-            framework_name="verifiers",
-            config_path=eval_config.config,
-            model_name=eval_config.model_name,
-            dataset_name=eval_config.dataset_name,
-            num_generations=eval_config.num_generations,
-            pull_latest=eval_config.pull,
-            services_only=eval_config.services
-        )
-    except Exception as e:
-        console.print(format_error_for_user(e), style="red")
-        suggestion = get_error_suggestions(e)
-        if suggestion:
-            console.print(suggestion, style="yellow")
-        return 1
+    _kubectl_json.cache_clear()
+    return _run_training(
+        "train_eval_command",
+        framework_name="verifiers",
+        config_path=eval_config.config,
+        model_name=eval_config.model_name,
+        dataset_name=eval_config.dataset_name,
+        num_generations=eval_config.num_generations,
+        pull_latest=eval_config.pull,
+        services_only=eval_config.services,
+        override_args=extra_args
+    )
 
 
 def logs_command(logs_config) -> int:
@@ -307,13 +361,13 @@ def status_command(job: str, watch: bool = False, output: str = "table") -> int:
 def resources_command() -> int:
     """Show available cluster resources (CPU, Memory, GPU)."""
     try:
+        from collections import defaultdict
+        from rich.console import Group
         from rich.table import Table
         from rich import box
-        import concurrent.futures
         
         # Get nodes data
-        result = kubectl("get", "nodes", "-o", "json", capture_output=True)
-        nodes_data = yaml.safe_load(result.stdout)
+        nodes_data = kubectl_json_stream("get", "nodes")
         
         # Create main summary table
         summary_table = Table(box=box.ROUNDED, title="🖥️ Cluster Resource Summary")
@@ -328,49 +382,35 @@ def resources_command() -> int:
         total_nodes_available = 0
         gpu_nodes = []
         
-        # Helper function to get node describe data
-        def get_node_describe_data(node_name):
-            try:
-                describe_result = kubectl("describe", "node", node_name, capture_output=True)
-                return node_name, describe_result.stdout
-            except Exception as e:
-                return node_name, None
-        
-        # Get all GPU-enabled nodes for parallel describe calls
-        gpu_node_names = []
-        node_info_map = {}
-        
-        for node in nodes_data.get("items", []):
-            node_name = node["metadata"]["name"]
-            node_info_map[node_name] = node
-            
-            capacity = node.get("status", {}).get("capacity", {})
-            gpu_capacity = capacity.get("nvidia.com/gpu", "0")
-            if gpu_capacity != "0" and gpu_capacity is not None:
-                gpu_node_names.append(node_name)
-        
-        # Run kubectl describe in parallel for all GPU nodes
-        describe_results = {}
-        if gpu_node_names:
-            console.print(f"🔍 Checking {len(gpu_node_names)} GPU nodes in parallel...", style="dim")
-            with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(gpu_node_names))) as executor:
-                future_to_node = {executor.submit(get_node_describe_data, node_name): node_name for node_name in gpu_node_names}
-                for future in concurrent.futures.as_completed(future_to_node):
-                    node_name, describe_text = future.result()
-                    describe_results[node_name] = describe_text
-        
-        # Process all nodes with the describe data
+        # One pod listing replaces a describe call per GPU node: sum the
+        # nvidia.com/gpu requests of running pods grouped by node
+        running_pods = kubectl_json_stream(
+            "get", "pods", "--all-namespaces",
+            "--field-selector=status.phase=Running"
+        )
+        gpu_used_by_node = defaultdict(int)
+        for pod in running_pods.get("items", []):
+            pod_node = pod["spec"].get("nodeName")
+            if not pod_node:
+                continue
+            for container in pod["spec"].get("containers", []):
+                requests = container.get("resources", {}).get("requests", {})
+                gpu_used_by_node[pod_node] += int(requests.get("nvidia.com/gpu", 0))
+        
+        # Process all nodes with the per-node GPU usage, accumulating rows
+        # first and feeding the table in one tight loop afterwards
+        rows = []
         for node in nodes_data.get("items", []):
             node_name = node["metadata"]["name"]
+            node_status = node.get("status", {})
             
             # Get node status
-            conditions = node.get("status", {}).get("conditions", [])
+            conditions = node_status.get("conditions", [])
             ready_condition = next((c for c in conditions if c["type"] == "Ready"), {})
             is_ready = ready_condition.get("status") == "True"
             
             # Check if scheduling is disabled
-            spec = node.get("spec", {})
-            unschedulable = spec.get("unschedulable", False)
+            unschedulable = node.get("spec", {}).get("unschedulable", False)
             
             if unschedulable:
                 status = "SchedulingDisabled"
@@ -380,8 +420,8 @@ def resources_command() -> int:
                 status = "Ready"
             
             # Get resource capacity and allocatable
-            capacity = node.get("status", {}).get("capacity", {})
-            allocatable = node.get("status", {}).get("allocatable", {})
+            capacity = node_status.get("capacity", {})
+            allocatable = node_status.get("allocatable", {})
             
             # Parse GPU info
             gpu_capacity = capacity.get("nvidia.com/gpu", "0")
@@ -389,32 +429,15 @@ def resources_command() -> int:
                 gpu_info = "No GPUs"
                 gpu_free = 0
             else:
-                # Use pre-fetched describe data
-                describe_text = describe_results.get(node_name)
-                if describe_text:
-                    # Extract GPU usage from describe output
-                    gpu_used = 0
-                    for line in describe_text.split('\n'):
-                        if 'nvidia.com/gpu' in line and 'Allocated resources' in describe_text[describe_text.find(line)-500:describe_text.find(line)]:
-                            parts = line.strip().split()
-                            if len(parts) >= 3:
-                                try:
-                                    gpu_used = int(parts[1])
-                                    break
-                                except:
-                                    pass
-                    
-                    gpu_total = int(gpu_capacity)
-                    gpu_free = max(0, gpu_total - gpu_used)
-                    gpu_info = f"{gpu_free}/{gpu_total} free"
-                    
-                    if gpu_total > 0:
-                        gpu_nodes.append((node_name, gpu_free, gpu_total, status))
-                        if status == "Ready":
-                            total_gpus_free += gpu_free
-                else:
-                    gpu_info = f"?/{gpu_capacity}"
-                    gpu_free = 0
+                gpu_total = int(gpu_capacity)
+                gpu_used = gpu_used_by_node.get(node_name, 0)
+                gpu_free = max(0, gpu_total - gpu_used)
+                gpu_info = f"{gpu_free}/{gpu_total} free"
+                
+                if gpu_total > 0:
+                    gpu_nodes.append((node_name, gpu_free, gpu_total, status))
+                    if status == "Ready":
+                        total_gpus_free += gpu_free
             
             # Parse CPU and Memory
             cpu_allocatable = allocatable.get("cpu", "0")
@@ -427,10 +450,10 @@ def resources_command() -> int:
             else:
                 cpu_info = f"{cpu_allocatable} cores"
             
-            # Convert Memory (e.g., "2111839476Ki" -> "2062 Gi")
+            # Convert Memory (e.g., "2111839476Ki" -> "2013Gi"); 1Gi is
+            # exactly 2^20 Ki, so an integer shift does the job
             if memory_allocatable.endswith('Ki'):
-                memory_gi = int(memory_allocatable[:-2]) / (1024 * 1024)
-                memory_info = f"{memory_gi:.0f}Gi"
+                memory_info = f"{int(memory_allocatable[:-2]) >> 20}Gi"
             else:
                 memory_info = memory_allocatable
             
@@ -447,37 +470,39 @@ def resources_command() -> int:
             else:
                 availability = "💻 CPU-only node"
             
-            summary_table.add_row(
-                node_name,
-                status,
-                gpu_info,
-                cpu_info,
-                memory_info,
-                availability
-            )
-        
-        console.print(summary_table)
-        
-        # Show summary stats
-        console.print(f"\n📊 **Summary:**")
-        console.print(f"• **Available full nodes** (8+ GPUs): {total_nodes_available}")
-        console.print(f"• **Total free GPUs**: {total_gpus_free}")
-        console.print(f"• **GPU nodes**: {len([n for n in gpu_nodes if n[2] > 0])}")
+            rows.append((node_name, status, gpu_info, cpu_info, memory_info, availability))
         
+        for row in rows:
+            summary_table.add_row(*row)
+
+        # Assemble everything and render in a single console.print so Rich
+        # does one layout/flush pass instead of one per section
+        renderables = [summary_table]
+
+        summary_stats = "\n".join([
+            "\n📊 **Summary:**",
+            f"• **Available full nodes** (8+ GPUs): {total_nodes_available}",
+            f"• **Total free GPUs**: {total_gpus_free}",
+            f"• **GPU nodes**: {len([n for n in gpu_nodes if n[2] > 0])}",
+        ])
+        renderables.append(summary_stats)
+
         # Always show detailed GPU breakdown
         if gpu_nodes:
-            console.print(f"\n🎯 **GPU Availability Details:**")
             gpu_table = Table(box=box.SIMPLE)
             gpu_table.add_column("Node", style="cyan")
-            gpu_table.add_column("Free/Total GPUs", style="green") 
+            gpu_table.add_column("Free/Total GPUs", style="green")
             gpu_table.add_column("Status", style="yellow")
-            
+
             # Sort by available GPUs (most available first)
             for node_name, gpu_free, gpu_total, status in sorted(gpu_nodes, key=lambda x: x[1], reverse=True):
                 gpu_table.add_row(node_name, f"{gpu_free}/{gpu_total}", status)
-            
-            console.print(gpu_table)
-        
+
+            renderables.append("\n🎯 **GPU Availability Details:**")
+            renderables.append(gpu_table)
+
+        console.print(Group(*renderables))
+
         return 0
         
     except subprocess.CalledProcessError as e:
@@ -524,7 +549,7 @@ def gpu_command(job: str = "", interval: int = 2) -> int:
         # Find the pod(s) for this job
         console.print(f"🔍 Finding pods for job {job}...", style="blue")
         result = kubectl("get", "pods", "-l", f"job-name={job}", "-o", "json", capture_output=True)
-        pods_data = yaml.safe_load(result.stdout)
+        pods_data = json.loads(result.stdout)
         
         if not pods_data.get('items'):
             console.print(f"❌ No pods found for job {job}", style="red")
@@ -574,39 +599,15 @@ def _force_delete_resources() -> int:
     from rich.prompt import Prompt
     import subprocess
     
-    # Get all CW resources
+    # Get all CW resources with one multi-resource kubectl call; the
+    # returned List mixes kinds, so carry each item's kind along
     cw_resources = []
-    
-    # Get jobs
-    try:
-        result = kubectl("get", "jobs", "-o", "json", capture_output=True)
-        jobs_data = yaml.safe_load(result.stdout)
-        for item in jobs_data.get("items", []):
-            name = item["metadata"]["name"]
-            if name.startswith("cw-"):
-                cw_resources.append(("job", name))
-    except subprocess.CalledProcessError:
-        pass
-    
-    # Get deployments
     try:
-        result = kubectl("get", "deployments", "-o", "json", capture_output=True)
-        deployments_data = yaml.safe_load(result.stdout)
-        for item in deployments_data.get("items", []):
+        resources_data = kubectl_json_stream("get", "jobs,deployments,services", "-l", _CW_SELECTOR)
+        for item in resources_data.get("items", []):
             name = item["metadata"]["name"]
             if name.startswith("cw-"):
-                cw_resources.append(("deployment", name))
-    except subprocess.CalledProcessError:
-        pass
-    
-    # Get services
-    try:
-        result = kubectl("get", "services", "-o", "json", capture_output=True)
-        services_data = yaml.safe_load(result.stdout)
-        for item in services_data.get("items", []):
-            name = item["metadata"]["name"]
-            if name.startswith("cw-"):
-                cw_resources.append(("service", name))
+                cw_resources.append((item["kind"].lower(), name))
     except subprocess.CalledProcessError:
         pass
     
@@ -639,13 +640,14 @@ def _force_delete_resources() -> int:
             console.print("⏹️ Deletion cancelled", style="yellow")
             return 0
         
-        # Delete all resources
-        for resource_type, name in cw_resources:
-            try:
-                kubectl("delete", resource_type, name)
-                console.print(f"✅ {resource_type.capitalize()} {name} deleted", style="green")
-            except subprocess.CalledProcessError as e:
-                console.print(f"❌ Failed to delete {resource_type} {name}: {e}", style="red")
+        # Delete everything carrying the CW label in one kubectl call
+        # instead of one round trip per resource
+        try:
+            kubectl("delete", "jobs,deployments,services,configmaps",
+                    "-l", _CW_SELECTOR, "--wait=false")
+            console.print(f"✅ Deleted {len(cw_resources)} CW resources", style="green")
+        except subprocess.CalledProcessError as e:
+            console.print(f"❌ Failed to delete CW resources: {e}", style="red")
     else:
         # Delete selected resource
         idx = int(choice) - 1
@@ -668,6 +670,7 @@ def _force_delete_resources() -> int:
 
 def delete_command(job: str) -> int:
     """Delete job and associated resources."""
+    _kubectl_json.cache_clear()
     try:
         # If no specific job is provided, show all CW resources for selection (force behavior by default)
         if not job:
@@ -693,9 +696,12 @@ def delete_command(job: str) -> int:
             console.print("⏹️ Deletion cancelled", style="yellow")
             return 0
         
-        kubectl("delete", "job", job)
-        console.print(f"✅ Job [bold]{job}[/] deleted successfully", style="green")
-        
+        # Delete the job and its ConfigMap in one kubectl call;
+        # --ignore-not-found covers ConfigMaps that were already cleaned up
+        configmap_name = "cw-axolotl-config" if is_grpo_job else "cw-axolotl-train-config"
+        kubectl("delete", f"job/{job}", f"configmap/{configmap_name}", "--ignore-not-found")
+        console.print(f"✅ Job [bold]{job}[/] and ConfigMap [bold]{configmap_name}[/] deleted", style="green")
+
         # If this is a GRPO job, clean up associated services
         if is_grpo_job:
             console.print("🧹 Cleaning up GRPO services...", style="blue")
@@ -703,15 +709,7 @@ def delete_command(job: str) -> int:
                 console.print("✅ GRPO services cleaned up successfully", style="green")
             else:
                 console.print("⚠️  Some GRPO services may not have been cleaned up", style="yellow")
-        
-        # Try to delete associated ConfigMap (may not exist)
-        configmap_name = "cw-axolotl-config" if is_grpo_job else "cw-axolotl-train-config"
-        try:
-            kubectl("delete", "configmap", configmap_name)
-            console.print(f"✅ ConfigMap [bold]{configmap_name}[/] deleted successfully", style="green")
-        except subprocess.CalledProcessError:
-            console.print(f"ℹ️  No associated ConfigMap {configmap_name} found to delete", style="cyan")
-        
+
         return 0
     except subprocess.CalledProcessError as e:
         console.print(f"❌ Failed to delete resources: {e}", style="red")
@@ -721,36 +719,33 @@ def delete_command(job: str) -> int:
 def list_command() -> int:
     """List CW-managed jobs only."""
     try:
-        result = kubectl("get", "jobs", "-o", "json", capture_output=True)
-        jobs_data = yaml.safe_load(result.stdout)
-        
-        # Filter only jobs with cw- prefix
-        cw_jobs = [job for job in jobs_data.get('items', []) 
-                   if job['metadata']['name'].startswith('cw-')]
-        
-        if not cw_jobs:
-            console.print("📋 No CW-managed jobs found", style="yellow")
-            return 0
-        
+        jobs_data = _kubectl_json("jobs", selector=_CW_SELECTOR)
+
         # Create table
         table = create_table("🚀 CW-Managed Jobs", [
             ("Job Name", "cyan"),
-            ("Status", "green"), 
+            ("Status", "green"),
             ("Active", "blue"),
             ("Succeeded", "green"),
             ("Failed", "red"),
             ("Age", "yellow")
         ])
-        
-        for job in cw_jobs:
+
+        # Filter cw- jobs and build rows in a single pass; one clock read
+        # covers every age cell
+        now = datetime.now(timezone.utc)
+        for job in jobs_data.get('items', []):
             name = job['metadata']['name']
+            if not name.startswith('cw-'):
+                continue
             status = job.get('status', {})
             creation_time = job['metadata']['creationTimestamp']
-            
+
             overall_status = get_job_status_emoji(status)
-            age = get_age_string(creation_time)
-            
-            table.add_row(
+            age = get_age_string(creation_time, now)
+
+            add_plain_row(
+                table,
                 name,
                 overall_status,
                 str(status.get('active', 0)),
@@ -758,7 +753,11 @@ def list_command() -> int:
                 str(status.get('failed', 0)),
                 age
             )
-        
+
+        if table.row_count == 0:
+            console.print("📋 No CW-managed jobs found", style="yellow")
+            return 0
+
         console.print(table)
         return 0
         
@@ -770,15 +769,8 @@ def list_command() -> int:
 def jobs_command(namespace: str = "default", all_namespaces: bool = False) -> int:
     """List all jobs in cluster."""
     try:
-        cmd_args = ["get", "jobs", "-o", "json"]
-        if all_namespaces:
-            cmd_args.append("--all-namespaces")
-        else:
-            cmd_args.extend(["-n", namespace])
-        
-        result = kubectl(*cmd_args, capture_output=True)
-        jobs_data = yaml.safe_load(result.stdout)
-        
+        jobs_data = _kubectl_json("jobs", namespace, all_namespaces)
+
         if not jobs_data.get('items'):
             ns_info = "all namespaces" if all_namespaces else f"namespace '{namespace}'"
             console.print(f"📋 No jobs found in {ns_info}", style="yellow")
@@ -796,17 +788,21 @@ def jobs_command(namespace: str = "default", all_namespaces: bool = False) -> in
         ])
         
         table = create_table("🏗️ All Cluster Jobs", columns)
-        
+
+        # Build rows and summary counters in a single pass over the items
+        total = len(jobs_data['items'])
+        running = completed = 0
+        now = datetime.now(timezone.utc)
         for job in jobs_data['items']:
             name = job['metadata']['name']
             ns = job['metadata']['namespace']
-            status = job.get('status', {})
-            spec = job.get('spec', {})
+            status = job.get('status') or {}
+            spec = job.get('spec') or {}
             creation_time = job['metadata']['creationTimestamp']
-            
+
             overall_status = get_job_status_emoji(status)
-            age = get_age_string(creation_time)
-            
+            age = get_age_string(creation_time, now)
+
             # Completions
             completions = spec.get('completions')
             succeeded = status.get('succeeded', 0)
@@ -814,21 +810,21 @@ def jobs_command(namespace: str = "default", all_namespaces: bool = False) -> in
                 completion_info = f"{succeeded}/{completions}"
             else:
                 completion_info = f"{succeeded}/1"
-            
+
+            if status.get('active', 0) > 0:
+                running += 1
+            if succeeded > 0:
+                completed += 1
+
             row_data = []
             if all_namespaces:
                 row_data.append(ns)
             row_data.extend([name, overall_status, completion_info, age])
-            
-            table.add_row(*row_data)
-        
+
+            add_plain_row(table, *row_data)
+
         console.print(table)
-        
-        # Summary
-        total = len(jobs_data['items'])
-        running = sum(1 for job in jobs_data['items'] if job.get('status', {}).get('active', 0) > 0)
-        completed = sum(1 for job in jobs_data['items'] if job.get('status', {}).get('succeeded', 0) > 0)
-        
+
         ns_info = "all namespaces" if all_namespaces else f"'{namespace}'"
         console.print(create_summary(f"Jobs in {ns_info}", total, running, completed))
         
@@ -862,8 +858,6 @@ def info_command(nodes: bool = False) -> int:
 
 def devpod_command(config) -> int:
     """Manage development pods."""
-    from .config import DevPodConfig
-    
     action = config.action.lower()
     
     if action == "list":
@@ -873,9 +867,10 @@ def devpod_command(config) -> int:
             console.print("📋 No devpods found in cluster", style="blue")
             return 0
         
-        console.print("📋 Available devpods:", style="blue")
-        for devpod in devpods:
-            console.print(f"  • {devpod}")
+        console.print(
+            "\n".join(["📋 Available devpods:"] + [f"  • {devpod}" for devpod in devpods]),
+            style="blue"
+        )
         return 0
     
     elif action == "start":
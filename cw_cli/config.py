@@ -4,15 +4,18 @@
 from dataclasses import dataclass
 from simple_parsing import field
 
+# slots=True keeps instances dict-free; frozen=True documents that parsed
+# CLI arguments are never mutated after construction.
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TrainConfig:
     """Train a model with Axolotl"""
     config: str = field(positional=True, help="Path to the SFT config YAML file")
     pull: bool = field(default=False, alias="--pull", help="Pull latest axolotl_dev code before training")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GrpoConfig:
     """Train a model with GRPO (requires multi-service deployment)"""
     config: str = field(positional=True, help="Path to the GRPO config YAML file")
@@ -20,13 +23,13 @@ class GrpoConfig:
     services: bool = field(default=False, alias="--services", help="Only launch services (VLLM and rewards) without training")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GrpoRestartConfig:
     """Restart GRPO services"""
     service: str = field(positional=True, help="Service to restart: 'vllm' or 'rewards'")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerifiersConfig:
     """Train a model with Verifiers GRPO (requires multi-service deployment)"""
     config: str = field(positional=True, help="Path to the Verifiers config YAML file")
@@ -34,7 +37,7 @@ class VerifiersConfig:
     services: bool = field(default=False, alias="--services", help="Only launch services (VLLM and rewards) without training")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvalConfig:
     """Evaluate a model with Verifiers (requires multi-service deployment)"""
     config: str = field(positional=True, help="Path to the Verifiers config YAML file")
@@ -45,7 +48,7 @@ class EvalConfig:
     services: bool = field(default=False, alias="--services", help="Only launch services (VLLM and rewards) without evaluation")
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class LogsConfig:
     """View job logs"""
     job: str = field(default="", alias="-j", help="Job name (optional)")
@@ -54,7 +57,7 @@ class LogsConfig:
     previous: bool = field(default=False, alias="-p", help="Show logs from previous container instance")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusConfig:
     """Check job status"""
     job: str = field(default="", alias="-j", help="Job name (optional)")
@@ -62,26 +65,26 @@ class StatusConfig:
     output: str = field(default="table", alias="-o", help="Output format: table, yaml, json")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeleteConfig:
     """Delete job and associated resources"""
     job: str = field(default="", help="Job name (optional - if not provided, shows all CW resources for selection)")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListConfig:
     """List all axolotl jobs"""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JobsConfig:
     """List all jobs in the cluster"""
     namespace: str = field(default="default", alias="-n", help="Kubernetes namespace")
     all_namespaces: bool = field(default=False, alias="-A", help="List jobs across all namespaces")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PodsConfig:
     """List all pods in the cluster"""
     namespace: str = field(default="default", alias="-n", help="Kubernetes namespace")
@@ -90,26 +93,26 @@ class PodsConfig:
     watch: bool = field(default=False, alias="-w", help="Watch for changes (live updates)")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InfoConfig:
     """Show cluster information and capabilities"""
     nodes: bool = field(default=False, alias="-n", help="Show detailed node information")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResourcesConfig:
     """Show available cluster resources"""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GpuConfig:
     """Watch GPU usage on training nodes"""
     job: str = field(default="", help="Job name (optional - will prompt if not provided)")
     interval: int = field(default=2, alias="-i", help="Update interval in seconds (default: 2)")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DevPodConfig:
     """Manage development pods"""
     action: str = field(positional=True, help="Action to perform: start, stop, ssh, delete, list")
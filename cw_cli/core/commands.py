@@ -2,7 +2,8 @@
 """Refactored command implementations using new abstractions."""
 
 import sys
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from .framework import TrainingJob, TrainingType
@@ -12,6 +13,21 @@ from ..utils import console
 from ..commands import parse_overrides, _follow_job_logs
 
 
+@lru_cache(maxsize=1)
+def _parsed_cli_overrides(config_str: str, config_name: str) -> Dict[str, Any]:
+    """Locate the config path in sys.argv once and parse the trailing overrides.
+
+    argv is fixed for the process, so the index scan and type coercion only
+    need to happen once even if several handlers ask for the overrides.
+    """
+    override_args = []
+    for i, arg in enumerate(sys.argv):
+        if arg in (config_str, config_name):
+            override_args = sys.argv[i + 1:]
+            break
+    return parse_overrides(override_args)
+
+
 class TrainingCommandHandler:
     """Handles training command operations."""
     
@@ -19,8 +35,9 @@ class TrainingCommandHandler:
         self.config_manager = get_config_manager()
     
     def handle_training_command(self, framework_name: str, training_type: TrainingType,
-                               config_path: str, pull_latest: bool = False, 
-                               services_only: bool = False) -> int:
+                               config_path: str, pull_latest: bool = False,
+                               services_only: bool = False,
+                               override_args: Optional[List[str]] = None) -> int:
         """Handle training command with new abstractions."""
         try:
             # Validate inputs
@@ -35,24 +52,32 @@ class TrainingCommandHandler:
                 console.print(f"❌ Error: Unsupported framework '{framework_name}'", style="red")
                 return 1
             
-            # Load and validate configuration
+            # Load and validate configuration, keeping the raw file text so
+            # it can be embedded verbatim when nothing modifies it
             try:
-                config_data = self.config_manager.load_config(config_file_path)
-                validated_config = self.config_manager.validate_config(config_data, framework_name)
+                raw_config = config_file_path.read_text()
+                config_data = self.config_manager.parse_config(raw_config)
+                # Services-only runs never train, so the training-schema
+                # validation is skipped; the services just need the parsed data
+                if not services_only:
+                    validated_config = self.config_manager.validate_config(config_data, framework_name)
             except Exception as e:
                 console.print(f"❌ Error loading configuration: {e}", style="red")
                 return 1
-            
-            # Parse command line overrides
-            overrides = self._parse_command_overrides(config_file_path)
+
+            # Parse command line overrides (still applied for services-only:
+            # they end up in the deployed ConfigMap the services read)
+            overrides = self._parse_command_overrides(config_file_path, override_args)
             if overrides:
+                raw_config = None  # config no longer matches the file text
                 config_data = self.config_manager.merge_overrides(config_data, overrides)
                 # Re-validate after overrides
-                try:
-                    validated_config = self.config_manager.validate_config(config_data, framework_name)
-                except Exception as e:
-                    console.print(f"❌ Error validating configuration with overrides: {e}", style="red")
-                    return 1
+                if not services_only:
+                    try:
+                        validated_config = self.config_manager.validate_config(config_data, framework_name)
+                    except Exception as e:
+                        console.print(f"❌ Error validating configuration with overrides: {e}", style="red")
+                        return 1
             
             # Create training job
             job = TrainingJob(
@@ -61,7 +86,8 @@ class TrainingCommandHandler:
                 training_type=training_type,
                 config_data=config_data,
                 pull_latest=pull_latest,
-                services_only=services_only
+                services_only=services_only,
+                raw_config=raw_config
             )
             
             # Deploy the job
@@ -83,25 +109,26 @@ class TrainingCommandHandler:
             console.print(f"❌ Unexpected error: {e}", style="red")
             return 1
     
-    def _parse_command_overrides(self, config_path: Path) -> Dict[str, Any]:
-        """Parse command line overrides from sys.argv."""
-        try:
-            # Find config file position in argv
-            config_idx = sys.argv.index(str(config_path))
-            override_args = sys.argv[config_idx + 1:]
-        except ValueError:
-            try:
-                config_idx = sys.argv.index(config_path.name)
-                override_args = sys.argv[config_idx + 1:]
-            except ValueError:
-                override_args = []
-        
-        overrides = parse_overrides(override_args)
-        
-        # Display overrides
-        for key, value in overrides.items():
-            console.print(f"🔧 Override: {key} = {value}", style="yellow")
-        
+    def _parse_command_overrides(self, config_path: Path,
+                                 override_args: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Parse command line overrides.
+
+        The CLI hands over the tokens argparse could not claim, already
+        split; the sys.argv scan only runs for direct programmatic calls
+        that do not supply them.
+        """
+        if override_args is not None:
+            overrides = parse_overrides(override_args)
+        else:
+            overrides = _parsed_cli_overrides(str(config_path), config_path.name)
+
+        # Display overrides in a single batched print
+        if overrides:
+            console.print(
+                "\n".join(f"🔧 Override: {key} = {value}" for key, value in overrides.items()),
+                style="yellow"
+            )
+
         return overrides
     
     def _follow_job_logs_if_requested(self, job_name: str):
@@ -159,19 +186,22 @@ def create_restart_handler() -> RestartCommandHandler:
 
 
 # Simplified command functions that use the new handlers
-def train_sft_command(framework_name: str, config_path: str, pull_latest: bool = False) -> int:
+def train_sft_command(framework_name: str, config_path: str, pull_latest: bool = False,
+                     override_args: Optional[List[str]] = None) -> int:
     """Train SFT model using new abstractions."""
     handler = create_training_handler()
     return handler.handle_training_command(
         framework_name=framework_name,
         training_type=TrainingType.SFT,
         config_path=config_path,
-        pull_latest=pull_latest
+        pull_latest=pull_latest,
+        override_args=override_args
     )
 
 
-def train_grpo_command(framework_name: str, config_path: str, pull_latest: bool = False, 
-                      services_only: bool = False) -> int:
+def train_grpo_command(framework_name: str, config_path: str, pull_latest: bool = False,
+                      services_only: bool = False,
+                      override_args: Optional[List[str]] = None) -> int:
     """Train GRPO model using new abstractions."""
     handler = create_training_handler()
     return handler.handle_training_command(
@@ -179,7 +209,8 @@ def train_grpo_command(framework_name: str, config_path: str, pull_latest: bool
         training_type=TrainingType.GRPO,
         config_path=config_path,
         pull_latest=pull_latest,
-        services_only=services_only
+        services_only=services_only,
+        override_args=override_args
     )
 
 
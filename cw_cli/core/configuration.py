@@ -7,6 +7,9 @@ from pathlib import Path
 from pydantic import BaseModel, ValidationError, Field, validator
 from enum import Enum
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class TrainingFramework(str, Enum):
     """Supported training frameworks."""
@@ -96,10 +99,13 @@ class ConfigurationManager:
         """Load configuration from YAML file."""
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
+
+        return self.parse_config(config_path.read_text())
+
+    def parse_config(self, config_text: str) -> Dict[str, Any]:
+        """Parse configuration data from raw YAML text."""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return yaml.load(config_text, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in configuration file: {e}")
     
@@ -8,7 +8,10 @@ import yaml
 from pathlib import Path
 
 from .framework import BaseTrainingFramework, TrainingJob, DeploymentResult, TrainingType
-from ..utils import console, run_kubectl_command, create_configmap_yaml
+from ..utils import (
+    console, kubectl, run_kubectl_command, create_configmap_yaml_from_text,
+    config_content_hash, CONFIG_HASH_ANNOTATION
+)
 
 
 class BaseDeploymentStrategy(ABC):
@@ -23,11 +26,36 @@ class BaseDeploymentStrategy(ABC):
         """Create and deploy ConfigMap for the job."""
         configmap_name = framework.get_configmap_name(job.training_type)
         clean_config = framework.prepare_config(job.config_data)
-        
+
+        # Embed the original file text verbatim when it is still an exact
+        # representation of the cleaned config; otherwise re-serialize
+        if job.raw_config is not None and clean_config == job.config_data:
+            config_text = job.raw_config
+        else:
+            config_text = yaml.dump(clean_config, default_flow_style=False)
+
+        # Skip the apply round-trip when the deployed content is identical
+        if self._configmap_hash_matches(configmap_name, config_content_hash(config_text)):
+            console.print("📝 ConfigMap unchanged, skipping apply", style="blue")
+            return True
+
         console.print("📝 Creating ConfigMap...", style="blue")
-        configmap_yaml = create_configmap_yaml(clean_config, configmap_name)
-        
+        configmap_yaml = create_configmap_yaml_from_text(config_text, configmap_name)
+
         return run_kubectl_command(configmap_yaml)
+
+    def _configmap_hash_matches(self, configmap_name: str, new_hash: str) -> bool:
+        """Check whether the deployed ConfigMap already carries this content hash."""
+        try:
+            result = kubectl(
+                "get", "configmap", configmap_name, "-o",
+                f"jsonpath={{.metadata.annotations.{CONFIG_HASH_ANNOTATION}}}",
+                capture_output=True
+            )
+            return result.stdout.strip() == new_hash
+        except Exception:
+            # Missing ConfigMap (or any lookup failure) simply means apply
+            return False
     
     def deploy_yaml_template(self, template_path: Path, context: Dict[str, Any]) -> bool:
         """Deploy a single YAML template with resource injection."""
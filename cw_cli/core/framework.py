@@ -24,6 +24,9 @@ class TrainingJob:
     config_data: Dict[str, Any]
     pull_latest: bool = False
     services_only: bool = False
+    # Original config file text, set when config_data matches it exactly
+    # (no overrides) so deployment can embed it without re-serializing
+    raw_config: Optional[str] = None
 
 
 @dataclass
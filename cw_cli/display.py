@@ -2,6 +2,7 @@
 """Display utilities for CW CLI."""
 
 from rich.table import Table
+from rich.text import Text
 from rich import box
 from datetime import datetime, timezone
 from typing import List, Tuple
@@ -10,19 +11,35 @@ from typing import List, Tuple
 def create_table(title: str, columns: List[Tuple[str, str]], show_header: bool = True) -> Table:
     """Create a standardized table."""
     table = Table(box=box.ROUNDED, title=title, show_header=show_header)
-    
+
     for col_name, style in columns:
         table.add_column(col_name, style=style)
-    
+
     return table
 
 
-def get_age_string(creation_time: str) -> str:
-    """Calculate age string from creation timestamp."""
+def add_plain_row(table: Table, *cells: str) -> None:
+    """Add a row of plain-text cells to a table.
+
+    Wrapping each cell in ``Text`` skips Rich's per-cell markup parse at
+    render time, which dominates when listing hundreds of jobs or pods.
+    Only use for cells that contain no Rich markup.
+    """
+    table.add_row(*(Text(cell) for cell in cells))
+
+
+def get_age_string(creation_time: str, now: datetime = None) -> str:
+    """Calculate age string from creation timestamp.
+
+    Row loops should take one ``datetime.now(timezone.utc)`` snapshot and
+    pass it in, so N rows cost one clock read instead of N.
+    """
     try:
         created = datetime.fromisoformat(creation_time.replace('Z', '+00:00'))
-        age_seconds = (datetime.now(timezone.utc) - created).total_seconds()
-        
+        if now is None:
+            now = datetime.now(timezone.utc)
+        age_seconds = (now - created).total_seconds()
+
         if age_seconds < 3600:  # Less than 1 hour
             return f"{int(age_seconds // 60)}m"
         elif age_seconds < 86400:  # Less than 1 day
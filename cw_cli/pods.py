@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Pods command implementation."""
 
-import yaml
+import json
 import time
+from datetime import datetime, timezone
 from rich.live import Live
 from rich.layout import Layout
 
@@ -50,7 +51,10 @@ def create_pods_display(pods_data: dict, namespace: str, all_namespaces: bool, s
         return
     
     pod_groups = group_pods_by_type(pods_data['items'])
-    
+
+    # One clock read for the whole render instead of one per row
+    now = datetime.now(timezone.utc)
+
     for group_name, pods in pod_groups.items():
         if not pods:
             continue
@@ -86,7 +90,7 @@ def create_pods_display(pods_data: dict, namespace: str, all_namespaces: bool, s
             
             phase = status.get('phase', 'Unknown')
             pod_status = get_pod_status_emoji(phase)
-            age = get_age_string(creation_time)
+            age = get_age_string(creation_time, now)
             
             row_data = []
             if all_namespaces:
@@ -114,6 +118,72 @@ def create_pods_display(pods_data: dict, namespace: str, all_namespaces: bool, s
     console.print(f"\n📊 Pods in {ns_info}: {total_pods} total, {running_pods} running, {completed_pods} completed, {failed_pods} failed (Updated: {timestamp})", style="cyan")
 
 
+def _watch_pods(namespace: str, all_namespaces: bool, show_resources: bool) -> int:
+    """Watch pods via a single kubectl watch-event stream.
+
+    Holds one long-lived kubectl connection and keeps an in-memory map of
+    pods updated from ADDED/MODIFIED/DELETED events, re-rendering the
+    display on changes instead of re-listing every pod each tick.
+    """
+    cmd_args = ["get", "pods", "--watch", "--output-watch-events", "-o", "json"]
+    if all_namespaces:
+        cmd_args.append("--all-namespaces")
+    else:
+        cmd_args.extend(["-n", namespace])
+
+    proc = kubectl(*cmd_args, stream=True)
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pods = {}
+
+    def render():
+        console.clear()
+        console.print("🔄 Watching pods... (Press Ctrl+C to stop)", style="blue")
+        console.print()
+        create_pods_display({'items': list(pods.values())}, namespace, all_namespaces, show_resources)
+
+    # Render the initial (possibly empty) state up front: with no matching
+    # pods there may never be an event to trigger the first redraw
+    render()
+
+    try:
+        for line in proc.stdout:
+            buffer += line
+            changed = False
+
+            # kubectl emits concatenated JSON documents; decode as many
+            # complete events as the buffer currently holds
+            while True:
+                buffer = buffer.lstrip()
+                if not buffer:
+                    break
+                try:
+                    event, end = decoder.raw_decode(buffer)
+                except ValueError:
+                    break
+                buffer = buffer[end:]
+
+                pod = event.get('object', {})
+                metadata = pod.get('metadata', {})
+                key = (metadata.get('namespace'), metadata.get('name'))
+                if event.get('type') == 'DELETED':
+                    pods.pop(key, None)
+                else:
+                    pods[key] = pod
+                changed = True
+
+            if changed:
+                render()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    # Reaching here means kubectl closed the stream on its own
+    # (network loss, credential expiry, server timeout)
+    console.print(f"\n⚠️ Pod watch ended (kubectl exited with code {proc.returncode})", style="yellow")
+    return 1 if proc.returncode else 0
+
+
 def handle_pods_display(namespace: str, all_namespaces: bool, show_resources: bool, watch: bool) -> int:
     """Handle pods display with optional watch mode."""
     try:
@@ -122,29 +192,19 @@ def handle_pods_display(namespace: str, all_namespaces: bool, show_resources: bo
             cmd_args.append("--all-namespaces")
         else:
             cmd_args.extend(["-n", namespace])
-        
+
         if watch:
             console.print("🔄 Watching pods... (Press Ctrl+C to stop)", style="blue")
-            
+
             try:
-                while True:
-                    # Clear screen for watch mode
-                    console.clear()
-                    console.print("🔄 Watching pods... (Press Ctrl+C to stop)", style="blue")
-                    console.print()
-                    
-                    result = kubectl(*cmd_args, capture_output=True)
-                    pods_data = yaml.safe_load(result.stdout)
-                    
-                    create_pods_display(pods_data, namespace, all_namespaces, show_resources)
-                    time.sleep(2)
+                return _watch_pods(namespace, all_namespaces, show_resources)
             except KeyboardInterrupt:
                 console.print("\n⏹️ Stopped watching.", style="yellow")
                 return 0
         else:
             # Single display
             result = kubectl(*cmd_args, capture_output=True)
-            pods_data = yaml.safe_load(result.stdout)
+            pods_data = json.loads(result.stdout)
             
             create_pods_display(pods_data, namespace, all_namespaces, show_resources)
         
@@ -4,27 +4,45 @@
 import yaml
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from rich.live import Live
 from rich.layout import Layout
 
 from .utils import console, kubectl
 from .display import create_table, get_age_string, get_pod_status_emoji, format_resources
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def get_status_data(job_name: str) -> tuple:
-    """Get job and pod status data."""
+
+def _get_job_data(job_name: str) -> dict:
+    """Get job status data."""
     try:
-        # Get job status
         job_result = kubectl("get", "job", job_name, "-o", "yaml", capture_output=True)
-        job_data = yaml.safe_load(job_result.stdout)
-        
-        # Get pod status
+        return yaml.load(job_result.stdout, Loader=_YamlLoader)
+    except:
+        return {}
+
+
+def _get_pod_data(job_name: str) -> dict:
+    """Get pod status data for a job."""
+    try:
         pod_result = kubectl("get", "pods", "-l", f"job-name={job_name}", "-o", "yaml", capture_output=True)
-        pod_data = yaml.safe_load(pod_result.stdout)
-        
-        return job_data, pod_data
+        return yaml.load(pod_result.stdout, Loader=_YamlLoader)
     except:
-        return {}, {}
+        return {}
+
+
+def get_status_data(job_name: str) -> tuple:
+    """Get job and pod status data, fetching both concurrently.
+
+    The two kubectl calls are independent, so overlapping them collapses
+    two API round trips into one on high-latency clusters.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        job_future = pool.submit(_get_job_data, job_name)
+        pod_future = pool.submit(_get_pod_data, job_name)
+        return job_future.result(), pod_future.result()
 
 
 def create_status_layout(job_data: dict, pod_data: dict, job_name: str) -> Layout:
@@ -73,6 +91,62 @@ def create_status_layout(job_data: dict, pod_data: dict, job_name: str) -> Layou
     return layout
 
 
+def _watch_status(job_name: str, initial_job_data: dict, initial_pod_data: dict) -> int:
+    """Watch job status via a pod watch stream instead of fixed-interval polling.
+
+    One long-lived kubectl watch pushes pod changes the moment they happen;
+    the job object is only re-fetched when an event arrives, so an idle job
+    costs zero API calls instead of two every couple of seconds.
+    """
+    proc = kubectl(
+        "get", "pods", "-l", f"job-name={job_name}",
+        "--watch", "--output-watch-events", "-o", "json",
+        stream=True
+    )
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pods = {pod['metadata']['name']: pod for pod in initial_pod_data.get('items', [])}
+
+    try:
+        with Live(console=console, refresh_per_second=2) as live:
+            live.update(create_status_layout(initial_job_data, {'items': list(pods.values())}, job_name))
+
+            for line in proc.stdout:
+                buffer += line
+                changed = False
+
+                # kubectl emits concatenated JSON events; decode as many
+                # complete ones as the buffer currently holds
+                while True:
+                    buffer = buffer.lstrip()
+                    if not buffer:
+                        break
+                    try:
+                        event, end = decoder.raw_decode(buffer)
+                    except ValueError:
+                        break
+                    buffer = buffer[end:]
+
+                    pod = event.get('object', {})
+                    name = pod.get('metadata', {}).get('name')
+                    if event.get('type') == 'DELETED':
+                        pods.pop(name, None)
+                    else:
+                        pods[name] = pod
+                    changed = True
+
+                if changed:
+                    layout = create_status_layout(
+                        _get_job_data(job_name), {'items': list(pods.values())}, job_name
+                    )
+                    live.update(layout)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    return 0
+
+
 def handle_status_output(job: str, watch: bool, output: str) -> int:
     """Handle status command with different output formats."""
     # Get initial data
@@ -100,21 +174,12 @@ def handle_status_output(job: str, watch: bool, output: str) -> int:
     # Handle watch mode
     if watch:
         console.print("🔄 Watching job status... (Press Ctrl+C to stop)", style="blue")
-        
-        with Live(console=console, refresh_per_second=2) as live:
-            try:
-                while True:
-                    job_data, pod_data = get_status_data(job)
-                    if not job_data:
-                        console.print(f"❌ Job '{job}' not found", style="red")
-                        return 1
-                    
-                    layout = create_status_layout(job_data, pod_data, job)
-                    live.update(layout)
-                    time.sleep(2)
-            except KeyboardInterrupt:
-                console.print("\n⏹️ Stopped watching.", style="yellow")
-                return 0
+
+        try:
+            return _watch_status(job, job_data, pod_data)
+        except KeyboardInterrupt:
+            console.print("\n⏹️ Stopped watching.", style="yellow")
+            return 0
     else:
         # Single status check
         layout = create_status_layout(job_data, pod_data, job)
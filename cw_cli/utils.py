@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
+import copy
+import hashlib
+import shutil
 import subprocess
-import yaml
 import time
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 from rich.console import Console
@@ -13,21 +16,54 @@ from rich import box
 # Initialize rich console
 console = Console()
 
+# Resolve the kubectl binary once instead of paying a PATH search per call
+_KUBECTL = shutil.which("kubectl") or "kubectl"
+
+
+def print_line(message: str, style: str = None):
+    """Print one plain-text line, bypassing Rich styling when not on a TTY.
+
+    Only for messages without Rich markup; hot paths (the kubectl command
+    echo, watch-loop status lines) use this so piped output skips Rich's
+    per-call formatting entirely.
+    """
+    if console.is_terminal:
+        console.print(message, style=style)
+    else:
+        print(message)
+
+
+def _yaml_loader():
+    """Prefer the libyaml-backed loader when PyYAML was built with it.
+
+    PyYAML is imported lazily: commands that never touch YAML skip its
+    import cost entirely.
+    """
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def kubectl(*args, input_data: str = None, capture_output: bool = False, stream: bool = False):
+    """Helper function to run kubectl commands.
+
+    With stream=True, returns the running Popen with stdout as a pipe so
+    callers can consume output while kubectl is still producing it.
+    """
+    cmd = [_KUBECTL] + list(args)
 
-def kubectl(*args, input_data: str = None, capture_output: bool = False) -> subprocess.CompletedProcess:
-    """Helper function to run kubectl commands."""
-    cmd = ["kubectl"] + list(args)
-    
     # Print the command in dimmed grey
-    cmd_str = " ".join(cmd)
+    cmd_str = " ".join(["kubectl"] + list(args))
     if input_data:
         # Truncate long input data for display
         input_preview = input_data[:100] + "..." if len(input_data) > 100 else input_data
         input_preview = input_preview.replace('\n', ' ')
-        console.print(f"$ {cmd_str} <<< {input_preview}", style="dim white")
+        print_line(f"$ {cmd_str} <<< {input_preview}", style="dim white")
     else:
-        console.print(f"$ {cmd_str}", style="dim white")
-    
+        print_line(f"$ {cmd_str}", style="dim white")
+
+    if stream:
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+
     return subprocess.run(
         cmd,
         input=input_data,
@@ -37,36 +73,89 @@ def kubectl(*args, input_data: str = None, capture_output: bool = False) -> subp
     )
 
 
-def create_configmap_yaml(config_data: Dict[str, Any], configmap_name: str) -> str:
-    """Create a ConfigMap YAML string from the config data."""
-    # Remove cluster-specific fields that shouldn't be passed to axolotl
-    clean_config = config_data.copy()
-    
-    # Remove fields that are used for cluster deployment but not axolotl training
-    cluster_fields = ['image', 'gpu', 'cpu', 'memory', 'resources']
-    for field in cluster_fields:
-        clean_config.pop(field, None)
-    
+def kubectl_json_stream(*args):
+    """Run kubectl with -o json and parse stdout directly from the pipe.
+
+    json.load on the pipe avoids buffering the whole payload into a string
+    first, halving peak memory for large resource listings.
+    """
+    proc = kubectl(*args, "-o", "json", stream=True)
+    try:
+        data = json.load(proc.stdout)
+    finally:
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+    return data
+
+
+# Annotation carrying the digest of the deployed config content; dashes
+# instead of a slash-prefixed key so it stays addressable from jsonpath
+CONFIG_HASH_ANNOTATION = 'cw-config-hash'
+
+
+def config_content_hash(config_text: str) -> str:
+    """Short digest of rendered config content, used to detect no-op redeploys."""
+    return hashlib.blake2b(config_text.encode(), digest_size=8).hexdigest()
+
+
+def create_configmap_yaml_from_text(config_text: str, configmap_name: str) -> str:
+    """Wrap already-rendered config YAML in a ConfigMap manifest."""
+    import yaml
     configmap = {
         'apiVersion': 'v1',
         'kind': 'ConfigMap',
         'metadata': {
-            'name': configmap_name
+            'name': configmap_name,
+            'labels': {
+                'app.kubernetes.io/managed-by': 'cw-axolotl'
+            },
+            'annotations': {
+                CONFIG_HASH_ANNOTATION: config_content_hash(config_text)
+            }
         },
         'data': {
-            'config.yaml': yaml.dump(clean_config, default_flow_style=False)
+            'config.yaml': config_text
         }
     }
     return yaml.dump(configmap, default_flow_style=False)
 
 
+def create_configmap_yaml(config_data: Dict[str, Any], configmap_name: str) -> str:
+    """Create a ConfigMap YAML string from the config data."""
+    import yaml
+
+    # Remove cluster-specific fields that shouldn't be passed to axolotl
+    clean_config = config_data.copy()
+
+    # Remove fields that are used for cluster deployment but not axolotl training
+    cluster_fields = ['image', 'gpu', 'cpu', 'memory', 'resources']
+    for field in cluster_fields:
+        clean_config.pop(field, None)
+
+    return create_configmap_yaml_from_text(
+        yaml.dump(clean_config, default_flow_style=False), configmap_name
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_template_docs(path_str: str, mtime: float) -> tuple:
+    """Parse a YAML template once per (path, mtime); edits invalidate the key.
+
+    Callers receive cached documents and must deep-copy before mutating.
+    """
+    import yaml
+    with open(path_str, 'r') as f:
+        return tuple(yaml.load_all(f, Loader=_yaml_loader()))
+
+
 def update_job_yaml_with_resources(job_yaml_path: Path, config_data: Dict[str, Any], pull_latest: bool = False) -> str:
     """Update the job YAML with resource requirements from the config."""
-    with open(job_yaml_path, 'r') as f:
-        yaml_content = f.read()
-    
-    # Parse the YAML first
-    job_data = yaml.safe_load(yaml_content)
+    import yaml
+
+    # Reuse the parsed template across submissions; deep-copying is much
+    # cheaper than re-parsing the YAML
+    docs = _load_yaml_template_docs(str(job_yaml_path), job_yaml_path.stat().st_mtime)
+    job_data = copy.deepcopy(docs[0])
     
     # Extract and apply container image from config
     if 'image' in config_data:
@@ -125,14 +214,15 @@ def run_kubectl_command(yaml_content: str, apply: bool = True) -> bool:
 
 def get_status_data(job_name: str) -> Tuple[dict, dict]:
     """Get job and pod status data."""
+    import yaml
     try:
         # Get job status
         job_result = kubectl("get", "job", job_name, "-o", "yaml", capture_output=True)
-        job_data = yaml.safe_load(job_result.stdout)
+        job_data = yaml.load(job_result.stdout, Loader=_yaml_loader())
         
         # Get pod status
         pod_result = kubectl("get", "pods", "-l", f"job-name={job_name}", "-o", "yaml", capture_output=True)
-        pod_data = yaml.safe_load(pod_result.stdout)
+        pod_data = yaml.load(pod_result.stdout, Loader=_yaml_loader())
         
         return job_data, pod_data
     except subprocess.CalledProcessError:
@@ -238,11 +328,11 @@ def create_status_layout(job_data: dict, pod_data: dict, job_name: str) -> Layou
 
 def update_grpo_yaml_with_resources(yaml_path: Path, config_data: Dict[str, Any], pull_latest: bool = False) -> str:
     """Update GRPO YAML files with resource requirements from the config."""
-    with open(yaml_path, 'r') as f:
-        yaml_content = f.read()
-    
-    # Split multi-document YAML if needed
-    yaml_docs = list(yaml.safe_load_all(yaml_content))
+    import yaml
+
+    # Multi-document templates come from the same mtime-keyed cache
+    docs = _load_yaml_template_docs(str(yaml_path), yaml_path.stat().st_mtime)
+    yaml_docs = copy.deepcopy(list(docs))
     
     # For GRPO, resources are typically full nodes, so we use standard values
     # unless overridden in the config
@@ -395,7 +485,7 @@ def cleanup_grpo_services() -> bool:
         try:
             # Get all resources of this type
             result = kubectl("get", resource_type, "-o", "json", capture_output=True)
-            resources_data = yaml.safe_load(result.stdout)
+            resources_data = json.loads(result.stdout)
             
             # Filter resources with cw-vllm or cw-rewards prefixes
             for item in resources_data.get("items", []):
@@ -464,8 +554,14 @@ def prompt_ssh_key_selection() -> str:
         return ""
 
 
+@lru_cache(maxsize=1)
 def get_available_devpods() -> List[str]:
-    """Get list of available devpods in the cluster."""
+    """Get list of available devpods in the cluster.
+
+    Cached for the process lifetime: the devpod ssh path lists twice
+    (selection prompt, then existence check) and both hit one kubectl
+    call this way. Mutating devpod helpers clear the cache.
+    """
     try:
         result = kubectl("get", "statefulsets", "-o", "json", capture_output=True)
         sts_data = json.loads(result.stdout)
@@ -525,6 +621,8 @@ def prompt_devpod_selection(action: str) -> str:
 
 def create_devpod_yaml(name: str, ssh_key_path: str, gpu: int = 8, cpu: int = 64, memory: str = "1200Gi") -> str:
     """Create devpod YAML with parameterized values."""
+    import yaml
+
     devpod_template_path = Path(__file__).parent / "kubeconfigs" / "dev-pod" / "devpod.yaml"
     
     with open(devpod_template_path, 'r') as f:
@@ -543,7 +641,7 @@ def create_devpod_yaml(name: str, ssh_key_path: str, gpu: int = 8, cpu: int = 64
     yaml_content = yaml_content.replace("parasail-devpod-2", f"parasail-devpod-{name}")
     
     # Parse YAML to update resources and SSH key
-    yaml_docs = list(yaml.safe_load_all(yaml_content))
+    yaml_docs = list(yaml.load_all(yaml_content, Loader=_yaml_loader()))
     
     for doc in yaml_docs:
         if not doc:
@@ -591,8 +689,9 @@ def deploy_devpod(name: str, ssh_key_path: str, gpu: int = 8, cpu: int = 64, mem
     yaml_content = create_devpod_yaml(name, ssh_key_path, gpu, cpu, memory)
     if not yaml_content:
         return False
-    
-    # Apply the configuration
+
+    # Apply the configuration; the cached listing is stale once this lands
+    get_available_devpods.cache_clear()
     return run_kubectl_command(yaml_content)
 
 
@@ -632,7 +731,8 @@ def ssh_to_devpod(devpod_name: str) -> bool:
 def cleanup_devpod(devpod_name: str) -> bool:
     """Clean up a devpod and all its resources."""
     console.print(f"🗑️ Deleting devpod {devpod_name}...", style="blue")
-    
+
+    get_available_devpods.cache_clear()
     success = True
     
     # Resources to clean up
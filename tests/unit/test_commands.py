@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Unit tests for the training command handler."""
+
+from unittest.mock import Mock, patch
+
+from cw_cli.core.commands import TrainingCommandHandler
+from cw_cli.core.framework import DeploymentResult, TrainingType
+
+
+def _make_handler(tmp_path):
+    """Build a handler with a mocked config manager and a config file."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("base_model: test/model\n")
+
+    handler = TrainingCommandHandler()
+    handler.config_manager = Mock()
+    handler.config_manager.parse_config.return_value = {"base_model": "test/model"}
+    handler.config_manager.merge_overrides.side_effect = lambda cfg, o: {**cfg, **o}
+
+    framework = Mock()
+    framework.get_job_name.return_value = "cw-test-job"
+    framework.deploy.return_value = DeploymentResult(success=True)
+
+    return handler, framework, config_file
+
+
+class TestServicesOnlyValidationSkip:
+    """Test that services-only deploys bypass training-schema validation."""
+
+    def test_services_only_skips_validation(self, tmp_path):
+        """Test --services runs never call validate_config."""
+        handler, framework, config_file = _make_handler(tmp_path)
+
+        with patch('cw_cli.core.commands.get_framework', return_value=framework):
+            result = handler.handle_training_command(
+                framework_name="axolotl",
+                training_type=TrainingType.GRPO,
+                config_path=str(config_file),
+                services_only=True,
+                override_args=[]
+            )
+
+        assert result == 0
+        handler.config_manager.validate_config.assert_not_called()
+
+    def test_training_run_validates(self, tmp_path):
+        """Test a normal training run still validates the config."""
+        handler, framework, config_file = _make_handler(tmp_path)
+
+        with patch('cw_cli.core.commands.get_framework', return_value=framework):
+            result = handler.handle_training_command(
+                framework_name="axolotl",
+                training_type=TrainingType.GRPO,
+                config_path=str(config_file),
+                services_only=False,
+                override_args=[]
+            )
+
+        assert result == 0
+        handler.config_manager.validate_config.assert_called_once()
+
+    def test_services_only_still_merges_overrides(self, tmp_path):
+        """Test overrides still reach the config in services-only mode."""
+        handler, framework, config_file = _make_handler(tmp_path)
+
+        with patch('cw_cli.core.commands.get_framework', return_value=framework):
+            result = handler.handle_training_command(
+                framework_name="axolotl",
+                training_type=TrainingType.GRPO,
+                config_path=str(config_file),
+                services_only=True,
+                override_args=["--gpu", "4"]
+            )
+
+        assert result == 0
+        handler.config_manager.merge_overrides.assert_called_once_with(
+            {"base_model": "test/model"}, {"gpu": 4}
+        )
+        handler.config_manager.validate_config.assert_not_called()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Unit tests for deployment strategies."""
+
+import yaml
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from cw_cli.core.deployment import SFTDeploymentStrategy
+from cw_cli.core.framework import TrainingJob, TrainingType
+from cw_cli.utils import config_content_hash
+
+
+def _make_job(config_data, raw_config=None):
+    """Build a minimal TrainingJob for ConfigMap tests."""
+    return TrainingJob(
+        name="cw-test-job",
+        config_path=Path("/tmp/config.yaml"),
+        training_type=TrainingType.SFT,
+        config_data=config_data,
+        raw_config=raw_config
+    )
+
+
+def _make_framework(clean_config):
+    """Build a framework mock exposing the ConfigMap hooks."""
+    framework = Mock()
+    framework.get_configmap_name.return_value = "cw-test-config"
+    framework.prepare_config.return_value = clean_config
+    return framework
+
+
+class TestConfigContentHash:
+    """Test config_content_hash."""
+
+    def test_deterministic(self):
+        """Test the same text always hashes identically."""
+        assert config_content_hash("a: 1\n") == config_content_hash("a: 1\n")
+
+    def test_differs_for_different_text(self):
+        """Test different texts produce different hashes."""
+        assert config_content_hash("a: 1\n") != config_content_hash("a: 2\n")
+
+
+class TestConfigMapHashSkip:
+    """Test the deployed-hash short-circuit in create_and_deploy_configmap."""
+
+    @patch('cw_cli.core.deployment.run_kubectl_command')
+    @patch('cw_cli.core.deployment.kubectl')
+    def test_hash_match_skips_apply(self, mock_kubectl, mock_run):
+        """Test a matching deployed hash skips the apply round-trip."""
+        clean_config = {"base_model": "test/model"}
+        config_text = yaml.dump(clean_config, default_flow_style=False)
+        mock_kubectl.return_value = Mock(stdout=config_content_hash(config_text) + "\n")
+
+        strategy = SFTDeploymentStrategy()
+        result = strategy.create_and_deploy_configmap(
+            _make_framework(clean_config), _make_job(clean_config)
+        )
+
+        assert result is True
+        mock_run.assert_not_called()
+
+    @patch('cw_cli.core.deployment.run_kubectl_command', return_value=True)
+    @patch('cw_cli.core.deployment.kubectl')
+    def test_hash_mismatch_applies(self, mock_kubectl, mock_run):
+        """Test a stale deployed hash still applies the ConfigMap."""
+        clean_config = {"base_model": "test/model"}
+        mock_kubectl.return_value = Mock(stdout="somethingelse\n")
+
+        strategy = SFTDeploymentStrategy()
+        result = strategy.create_and_deploy_configmap(
+            _make_framework(clean_config), _make_job(clean_config)
+        )
+
+        assert result is True
+        mock_run.assert_called_once()
+
+    @patch('cw_cli.core.deployment.run_kubectl_command', return_value=True)
+    @patch('cw_cli.core.deployment.kubectl', side_effect=Exception("not found"))
+    def test_lookup_failure_applies(self, mock_kubectl, mock_run):
+        """Test a missing ConfigMap (lookup error) falls through to apply."""
+        clean_config = {"base_model": "test/model"}
+
+        strategy = SFTDeploymentStrategy()
+        result = strategy.create_and_deploy_configmap(
+            _make_framework(clean_config), _make_job(clean_config)
+        )
+
+        assert result is True
+        mock_run.assert_called_once()
+
+    @patch('cw_cli.core.deployment.run_kubectl_command', return_value=True)
+    @patch('cw_cli.core.deployment.kubectl', side_effect=Exception("not found"))
+    def test_raw_config_embedded_verbatim(self, mock_kubectl, mock_run):
+        """Test the original file text is embedded when nothing modified it."""
+        raw = "# my config\nbase_model: test/model\n"
+        config_data = {"base_model": "test/model"}
+
+        strategy = SFTDeploymentStrategy()
+        strategy.create_and_deploy_configmap(
+            _make_framework(config_data), _make_job(config_data, raw_config=raw)
+        )
+
+        applied = yaml.safe_load(mock_run.call_args[0][0])
+        assert applied['data']['config.yaml'] == raw
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Unit tests for command line override parsing."""
+
+from cw_cli.commands import parse_overrides
+
+
+class TestParseOverrides:
+    """Test parse_overrides type coercion."""
+
+    def test_int_value(self):
+        """Test integer values are coerced to int."""
+        assert parse_overrides(["--gpu", "4"]) == {"gpu": 4}
+
+    def test_negative_int_value(self):
+        """Test negative integer values are coerced to int."""
+        assert parse_overrides(["--offset", "-2"]) == {"offset": -2}
+
+    def test_float_value(self):
+        """Test float values are coerced to float."""
+        assert parse_overrides(["--learning_rate", "0.0002"]) == {"learning_rate": 0.0002}
+
+    def test_string_value(self):
+        """Test non-numeric values stay strings."""
+        assert parse_overrides(["--base_model", "org/model"]) == {"base_model": "org/model"}
+
+    def test_dotted_version_stays_string(self):
+        """Test multi-dot values are not mangled into numbers."""
+        assert parse_overrides(["--version", "1.2.3"]) == {"version": "1.2.3"}
+
+    def test_bool_literals(self):
+        """Test true/false literals map to booleans, any case."""
+        assert parse_overrides(["--fp16", "true"]) == {"fp16": True}
+        assert parse_overrides(["--resume", "FALSE"]) == {"resume": False}
+
+    def test_null_literal(self):
+        """Test null literal maps to None."""
+        assert parse_overrides(["--seed", "null"]) == {"seed": None}
+
+    def test_flag_without_value(self):
+        """Test a bare flag becomes a True boolean."""
+        assert parse_overrides(["--services"]) == {"services": True}
+
+    def test_mixed_arguments(self):
+        """Test a realistic mixed override list."""
+        overrides = parse_overrides(
+            ["--gpu", "8", "--lr", "1e-4", "--fp16", "true", "--name", "run1"]
+        )
+        assert overrides == {"gpu": 8, "lr": 1e-4, "fp16": True, "name": "run1"}
+
+    def test_empty_arguments(self):
+        """Test empty argument list yields no overrides."""
+        assert parse_overrides([]) == {}